@@ -108,15 +108,23 @@ def process(newDb_zConn, hostname: str, filesys_id: int, batch_id: int, oldDb_Pa
 
 		LEN_REMOVE_FROM_PREFIX=len(pathSubStr)
 
+		## Subtree filter as a half-open range rather than "LIKE 'x%'": LIKE is case-insensitive by default so it can't use a BINARY index on path_rltv (full scan), and treats '_' and '%' in the path as wildcards.
+		## Behavior change: match is now exact-case. LIKE also selected paths whose prefix differed from pathSubStr only in ASCII case; those rows are no longer loaded.
 		sqlWhere=""
+		sqlParams=None
 		if not z.isEmpty(pathSubStr):
-			sqlWhere="WHERE path_rltv LIKE '{}%'".format(pathSubStr)
+			sqlWhere="WHERE path_rltv >= ?"
+			sqlParams=(pathSubStr,)
+			upperBound=strPrefixSuccessor(pathSubStr)
+			if not upperBound is None:
+				sqlWhere += " AND path_rltv < ?"
+				sqlParams=(pathSubStr, upperBound)
 
 		## Query records from old aka source
 		z.echo1("Querying ...")
 		oldDb_zConn=zdb.ZdbSqlLite3v3()
 		oldDb_zConn.openDb1(oldDb_Path)
-		oldDb_zCurs=oldDb_zConn.runSql(sql_OldDb(sqlWhere))
+		oldDb_zCurs=oldDb_zConn.runSql(sql_OldDb(sqlWhere), paramsTuple=sqlParams)
 		z.echo1("Loading results into memory ...")
 		oldDb_Rows=oldDb_zCurs.fetchAll()
 		oldDbRowCount=oldDb_zCurs.fetchedRowCount
@@ -235,6 +243,21 @@ def process(newDb_zConn, hostname: str, filesys_id: int, batch_id: int, oldDb_Pa
 					z.echo_clean1("    {} records skipped due to duplicate paths.".format(skippedoldDbRowCount))
 
 
+def strPrefixSuccessor(prefix: str):
+	##	Purpose:
+	##		- Returns the smallest string greater than every string starting with 'prefix', for use as an exclusive upper bound.
+	##		- Increments the last char, skipping the surrogate range (can't be bound by sqlite3), and carrying left past U+10FFFF.
+	##	Returns: The successor string, or None if there isn't one (all chars U+10FFFF, or empty), meaning no upper bound.
+	chars=list(prefix)
+	while len(chars)>0:
+		nextOrdinal=ord(chars.pop()) + 1
+		if 0xD800 <= nextOrdinal <= 0xDFFF:
+			nextOrdinal=0xE000
+		if nextOrdinal <= 0x10FFFF:
+			return "".join(chars) + chr(nextOrdinal)
+	return None
+
+
 def sql_InsertIntoNew():
 	##	History:
 	##		- 20191007 JC: Created.
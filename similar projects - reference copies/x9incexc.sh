@@ -119,6 +119,22 @@ function fPrint_Syntax(){ _fdbgEnter "${FUNCNAME[0]}";
 		_fEcho_Clean "        Use --FileTypeMacroScript <string> to override with your own."
 #		_fEcho_Clean "    --final-filter \"filter string\""
 #		_fEcho_Clean "        One last filter pass, using --patterns-from syntax."
+		## --serve/--connect: Proposal only. Not feasible in Bash; client/server wire format not yet defined.
+#		_fEcho_Clean "    --serve <socket filespec>"
+#		_fEcho_Clean "        Don't exit after one list; stay resident and answer list requests on a"
+#		_fEcho_Clean "            local Unix domain socket. Compiled --patterns-from programs,"
+#		_fEcho_Clean "            built-in filter macros, and scan metadata are kept in memory"
+#		_fEcho_Clean "            between requests, so each request only pays for filter evaluation."
+#		_fEcho_Clean "        Each request is the same arguments as a normal run; results stream"
+#		_fEcho_Clean "            back as they're produced."
+#		_fEcho_Clean "    --connect <socket filespec>"
+#		_fEcho_Clean "        Send this run's arguments to a '--serve' instance instead of doing the"
+#		_fEcho_Clean "            work locally."
+#		_fEcho_Clean "        Relative paths (scan folders, --patterns-from) are resolved on the"
+#		_fEcho_Clean "            client: it sends them as absolute paths, along with its working"
+#		_fEcho_Clean "            directory."
+#		_fEcho_Clean "        --output-file and --output-file_excluded are written by the client,"
+#		_fEcho_Clean "            from the streamed results; the server writes no files."
 		_fEcho_Clean "    --output-file <filespec>"
 		_fEcho_Clean "        Filespec of output list of included files."
 		_fEcho_Clean "    --output-file_excluded <filespec>"
@@ -54,6 +54,29 @@ def _unitTests():
 	z.echo_clean()
 	z.echo_clean("Useful:\n" + sqlString.get())
 
+	z.printUnitTestFlowerbox("ZsqlLite3 shards")
+	catalogDb=ZsqlLite3(":memory:")
+	for filesys_id in [1, 2]:
+		catalogDb.attachDb(":memory:", "shard_{}".format(filesys_id))
+		if filesys_id==2:
+			z.echo_clean("Before table .: " + str(catalogDb.getRowCountViaSql("file", idColName="*")))  ## New shard attached but no table yet; view must still work
+		catalogDb.runSql("CREATE TABLE shard_{0}.file ( filesys_id INTEGER NOT NULL, path_rltv TEXT NOT NULL );".format(filesys_id))
+		catalogDb.runSql("INSERT INTO shard_{0}.file ( filesys_id, path_rltv ) VALUES ( ?, ? );".format(filesys_id), paramsTuple=(filesys_id, "a/b.txt"))
+		if filesys_id==1:
+			catalogDb.createUnionAllView("file", "file", schemaPrefix="shard_")
+		else:
+			catalogDb.refreshUnionAllViews()
+	z.echo_clean("Attached .....: " + str(catalogDb.getAttachedDbNames()))
+	z.echo_clean("Rows in view .: " + str(catalogDb.getRowCountViaSql("file", idColName="*")))
+	catalogDb.attachDb(":memory:", "olddb")
+	catalogDb.runSql("CREATE TABLE olddb.file ( path_rltv TEXT );")
+	catalogDb.refreshUnionAllViews()
+	z.echo_clean("Non-shard ....: " + str(catalogDb.getRowCountViaSql("file", idColName="*")))  ## Different layout, no 'shard_' prefix; mustn't join
+	catalogDb.detachDb("olddb")
+	catalogDb.detachDb("shard_2")
+	z.echo_clean("After detach .: " + str(catalogDb.getRowCountViaSql("file", idColName="*")))
+	catalogDb=None
+
 	z.echo_clean()
 
 
@@ -187,6 +210,119 @@ class ZsqlLite3:
 		self._conn.row_factory=self._sqlite3.Row
 		self._conn.isolation_level = None  ## Gain more control over transactions; 'executescript()' still issues a 'COMMIT' before running though.
 		self._conn.executescript("pragma foreign_keys") ## Enable foreign key support
+		self._unionAllViews={}  ## {viewName: [tableName, schemaNames or None for auto, schemaPrefix]}; TEMP views die with the connection
+		self._unionAllViewsSql={}  ## {viewName: CREATE TEMP VIEW statement currently in effect}; for putting things back if a rebuild fails
+
+	def attachDb(self, dbSpec: str, schemaName: str):
+		##	Purpose:
+		##		- Attaches another database to this connection, e.g. one per-filesys_id shard to a catalogue DB.
+		##		- Its tables are then addressable as '<schemaName>.<table>'. Created if it doesn't exist, same as openOrCreateDb().
+		##		- Auto-membership views from createUnionAllView() are rebuilt to include it, if it qualifies (see there).
+		##	Arguments:
+		##		dbSpec .......: A file specification, or :memory: style syntax.
+		##		schemaName ...: Name to attach it as, e.g. 'shard_3'.
+		##	Returns: (nothing)
+		##	Notes:
+		##		- If a rebuilt view doesn't work (e.g. a same-named table with different columns), the attach is undone and ValueError raised.
+		##		- Foreign keys can't reference tables in another attached DB, so shard tables can't have FKs to catalogue tables.
+		if hasattr(self._conn, "getlimit"):  ## Python 3.11+
+			maxAttached=self._conn.getlimit(self._sqlite3.SQLITE_LIMIT_ATTACHED)
+			if len(self.getAttachedDbNames()) >= maxAttached:
+				raise ValueError(z.getMeName(sys._getframe().f_code.co_name) + ": Can't attach '" + str(schemaName) + "'; SQLite allows at most {} attached databases per connection (SQLITE_MAX_ATTACHED; default 10, compile-time max 125).".format(maxAttached))
+		self._conn.execute("ATTACH DATABASE ? AS ?;", (dbSpec, schemaName))
+		try:
+			self._applyUnionAllViews(self._copyUnionAllViews())
+		except ValueError:
+			self._conn.execute("DETACH DATABASE ?;", (schemaName,))
+			raise
+
+	def detachDb(self, schemaName: str):
+		##	Purpose:
+		##		- Detaches a database.
+		##		- Views from createUnionAllView() that referenced it are first rebuilt without it, or dropped if it was their only source. (Otherwise they'd fail with 'no such table', and shadow the catalogue's own table.)
+		##		- If a rebuilt view doesn't work, nothing is detached and ValueError is raised.
+		##	Returns: (nothing)
+		newViews=self._copyUnionAllViews()
+		for viewSpec in newViews.values():
+			if not viewSpec[1] is None:
+				viewSpec[1]=[otherName for otherName in viewSpec[1] if otherName != schemaName]
+		self._applyUnionAllViews(newViews, excludeSchemaName=schemaName)
+		self._conn.execute("DETACH DATABASE ?;", (schemaName,))
+
+	def getAttachedDbNames(self):
+		##	Returns: List of attached schema names, in order attached (excludes 'main' and 'temp').
+		rows=self._conn.execute("PRAGMA database_list;").fetchall()
+		return [row["name"] for row in rows if row["name"] not in ("main", "temp")]
+
+	def createUnionAllView(self, viewName: str, tableName: str, schemaNames=None, schemaPrefix=""):
+		##	Purpose:
+		##		- Creates a view that stitches the same table from multiple attached DBs (e.g. 'file' from every shard) back into one.
+		##		- Named the same as the sharded table, existing unqualified queries (e.g. 'SELECT ... FROM file') keep working unchanged.
+		##	Arguments:
+		##		viewName .......: Name of view to create; any existing view of that name is replaced.
+		##		tableName ......: Table name that exists in every schema.
+		##		schemaNames ....: List of schema names to include. Default is auto-membership: every attached schema that starts with
+		##		                  schemaPrefix AND already has 'tableName', re-evaluated on attachDb(), detachDb(), and refreshUnionAllViews().
+		##		schemaPrefix ...: For auto-membership only, e.g. 'shard_', so unrelated attached DBs with a same-named table don't join.
+		##	Returns: (nothing)
+		##	Notes:
+		##		- Must be a TEMP view: SQLite refuses persistent views that reference other attached DBs. So it's gone after reconnecting.
+		##		- TEMP objects are resolved before 'main', so the view shadows any same-named table in the catalogue.
+		##		- A WHERE on the view is pushed down into each UNION ALL branch, so each shard's own indexes are used.
+		##		- A newly attached shard only joins once its table exists; call refreshUnionAllViews() after creating it.
+		##		- Each rebuilt view is probed; if it doesn't work, the previous views are put back and ValueError is raised.
+		newViews=self._copyUnionAllViews()
+		newViews[viewName]=[tableName, None if schemaNames is None else list(schemaNames), schemaPrefix]
+		if len(self._getUnionAllViewSchemas(newViews[viewName]))<=0:
+			raise ValueError(z.getMeName(sys._getframe().f_code.co_name) + ": No schemas to create view '" + str(viewName) + "' from.")
+		self._applyUnionAllViews(newViews)
+
+	def refreshUnionAllViews(self):
+		##	Purpose: Rebuilds auto-membership views from createUnionAllView(), e.g. after creating the table in a newly attached shard.
+		##	Returns: (nothing)
+		self._applyUnionAllViews(self._copyUnionAllViews())
+
+	def _copyUnionAllViews(self):
+		return {viewName: [viewSpec[0], None if viewSpec[1] is None else list(viewSpec[1]), viewSpec[2]] for viewName, viewSpec in self._unionAllViews.items()}
+
+	def _getUnionAllViewSchemas(self, viewSpec, excludeSchemaName=None):
+		## Returns: List of schema names the view should currently select from.
+		tableName, schemaNames, schemaPrefix=viewSpec
+		if not schemaNames is None:
+			return schemaNames
+		retVal=[]
+		for schemaName in self.getAttachedDbNames():
+			if schemaName != excludeSchemaName and schemaName.startswith(schemaPrefix):
+				sql="SELECT count(*) FROM {}.sqlite_master WHERE type IN ('table', 'view') AND name = ? COLLATE NOCASE;".format(_quoteIdentifier(schemaName))
+				if self._conn.execute(sql, (tableName,)).fetchone()[0] > 0:
+					retVal.append(schemaName)
+		return retVal
+
+	def _applyUnionAllViews(self, newViews, excludeSchemaName=None):
+		## (Re)create TEMP union views per 'newViews'; dropped and forgotten if no schemas are left.
+		## Each is probed, since SQLite only resolves a view's tables when it's used. On any failure, the previous views are put back and ValueError raised.
+		## Separate execute() calls rather than one script, since executescript() would COMMIT any open transaction.
+		newViewsSql={}
+		try:
+			for viewName in set(self._unionAllViewsSql.keys()) | set(newViews.keys()):
+				self._conn.execute("DROP VIEW IF EXISTS temp.{};".format(_quoteIdentifier(viewName)))
+			for viewName in list(newViews.keys()):
+				schemaNames=self._getUnionAllViewSchemas(newViews[viewName], excludeSchemaName)
+				if len(schemaNames)<=0:
+					del newViews[viewName]
+				else:
+					selectList=["SELECT * FROM {}.{}".format(_quoteIdentifier(schemaName), _quoteIdentifier(newViews[viewName][0])) for schemaName in schemaNames]
+					newViewsSql[viewName]="CREATE TEMP VIEW {} AS {};".format(_quoteIdentifier(viewName), " UNION ALL ".join(selectList))
+					self._conn.execute(newViewsSql[viewName])
+					self._conn.execute("SELECT 1 FROM temp.{} LIMIT 0;".format(_quoteIdentifier(viewName))).fetchall()
+		except self._sqlite3.Error as e:
+			for viewName in set(self._unionAllViewsSql.keys()) | set(newViewsSql.keys()):
+				self._conn.execute("DROP VIEW IF EXISTS temp.{};".format(_quoteIdentifier(viewName)))
+			for oldSql in self._unionAllViewsSql.values():
+				self._conn.execute(oldSql)
+			raise ValueError(z.getMeName(sys._getframe().f_code.co_name) + ": Union view '" + str(viewName) + "' doesn't work, previous views restored: " + str(e))
+		self._unionAllViews=newViews
+		self._unionAllViewsSql=newViewsSql
 
 	def getRowCountViaSql(self, tableName: str, idColName="rowid", whereClause=""):
 		sql="SELECT count({}) FROM {}".format(idColName, tableName)
@@ -233,6 +369,10 @@ class ZsqlLite3:
 	def native_connection(self):
 		return self._conn
 
+def _quoteIdentifier(identifier: str):
+	## Double-quote a SQL identifier (so keywords like 'order' or odd chars are safe), escaping embedded quotes.
+	return '"' + str(identifier).replace('"', '""') + '"'
+
 class Zsqlite3_zCursor:
 
 	def __init__(self, parentConn):